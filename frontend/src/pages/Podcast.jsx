@@ -327,7 +327,7 @@ const GitHubPodcastGenerator = () => {
 
                 <a
                   href={`http://localhost:8000${podcastData.audio_url}`}
-                  download={`${podcastData.repo_info.owner}-${podcastData.repo_info.repo}-podcast.mp3`}
+                  download={`${podcastData.repo_info.owner}-${podcastData.repo_info.repo}-podcast.${podcastData.audio_url.split('.').pop()}`}
                   className="group relative p-4 bg-gray-800/50 border border-gray-600 text-gray-400 hover:border-green-500 hover:text-green-400 rounded-full transform hover:scale-110 transition-all duration-300"
                 >
                   <Download className="h-6 w-6 group-hover:scale-110 transition-transform duration-300" />
@@ -12,39 +12,14 @@ import re
 import uuid
 from pathlib import Path
 import tempfile
-import shutil
-
-# TTS imports
-try:
-    import edge_tts
-    EDGE_TTS_AVAILABLE = True
-except ImportError:
-    EDGE_TTS_AVAILABLE = False
-
-try:
-    import pyttsx3
-    PYTTSX3_AVAILABLE = True
-except ImportError:
-    PYTTSX3_AVAILABLE = False
-
-try:
-    from gtts import gTTS
-    GTTS_AVAILABLE = True
-except ImportError:
-    GTTS_AVAILABLE = False
-
-try:
-    import win32com.client
-    SAPI_AVAILABLE = True
-except ImportError:
-    SAPI_AVAILABLE = False
-
-# Audio processing imports
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
+import subprocess
+import importlib
+import importlib.util
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 load_dotenv()
 
@@ -66,6 +41,164 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 GITHUB_API_KEY = os.getenv("GITHUB_API_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+# Long-form script generation (outline first, then sections in parallel)
+LONG_FORM_DEFAULT = os.getenv("PODCAST_LONG_FORM", "false").lower() in ("1", "true", "yes")
+MAX_OUTLINE_SECTIONS = 8
+# Matching the section cap lets every segment run in a single wave
+SECTION_CONCURRENCY = int(os.getenv("PODCAST_SECTION_CONCURRENCY", str(MAX_OUTLINE_SECTIONS)))
+SECTION_ATTEMPTS = 2
+GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT", "90"))
+
+# Audio post-processing (runs in a process pool so encoding never blocks the event loop)
+AUDIO_PRESETS = {
+    # Same output as before: 128k MP3, channels and sample rate kept from the source voices
+    "standard": {"format": "mp3", "ext": "mp3", "codec": "libmp3lame", "bitrate": "128k", "channels": None, "sample_rate": None, "extra": []},
+    # Low-bitrate mono MP3, plenty for spoken word
+    "speech": {"format": "mp3", "ext": "mp3", "codec": "libmp3lame", "bitrate": "48k", "channels": 1, "sample_rate": 22050, "extra": []},
+    # Opus in an OGG container, smallest files for the same speech quality
+    "opus": {"format": "ogg", "ext": "ogg", "codec": "libopus", "bitrate": "32k", "channels": 1, "sample_rate": 48000, "extra": ["-application", "voip"]},
+}
+AUDIO_PRESET_DEFAULT = os.getenv("PODCAST_AUDIO_PRESET", "standard")
+if AUDIO_PRESET_DEFAULT not in AUDIO_PRESETS:
+    print(f"⚠️ Unknown PODCAST_AUDIO_PRESET '{AUDIO_PRESET_DEFAULT}', using 'standard'")
+    AUDIO_PRESET_DEFAULT = "standard"
+TARGET_LOUDNESS_DBFS = float(os.getenv("PODCAST_TARGET_DBFS", "-20"))
+PEAK_HEADROOM_DB = 1.0
+AUDIO_WORKERS = int(os.getenv("PODCAST_AUDIO_WORKERS", "2"))
+
+audio_pool = None
+
+# TTS / audio backends, imported on first use
+PREWARM_ENGINES = [name.strip() for name in os.getenv("PODCAST_PREWARM_ENGINES", "").split(",") if name.strip()]
+
+class LazyEngine:
+    """An optional backend module that is probed at startup but only imported when first needed"""
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        # find_spec on the top-level package checks it is installed without importing it
+        self.available = importlib.util.find_spec(module_name.split('.')[0]) is not None
+        self.module = None
+        self.import_time_ms = None
+        self.error = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Import the module (once) and return it, or None if it cannot be imported"""
+        if self.module is not None or not self.available:
+            return self.module
+
+        with self._lock:
+            if self.module is None and self.available:
+                start = time.perf_counter()
+                try:
+                    self.module = importlib.import_module(self.module_name)
+                except Exception as e:
+                    self.available = False
+                    self.error = str(e)
+                    print(f"⚠️ Failed to import {self.module_name}: {e}")
+                self.import_time_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        return self.module
+
+    def status(self):
+        return {
+            "available": self.available,
+            "loaded": self.module is not None,
+            "import_time_ms": self.import_time_ms,
+            "error": self.error
+        }
+
+ENGINES = {
+    "edge_tts": LazyEngine("edge_tts"),
+    "pyttsx3": LazyEngine("pyttsx3"),
+    "gtts": LazyEngine("gtts"),
+    "sapi": LazyEngine("comtypes.client"),
+    "pydub": LazyEngine("pydub"),
+}
+
+def engine_available(name):
+    return ENGINES[name].available
+
+def load_engine(name):
+    return ENGINES[name].load()
+
+async def prewarm_engines(names):
+    """Import the configured engines in a background thread so the first request doesn't pay for it"""
+    for name in names:
+        if name not in ENGINES:
+            print(f"⚠️ Unknown engine '{name}' in PODCAST_PREWARM_ENGINES")
+            continue
+        engine = ENGINES[name]
+        if name == "pydub":
+            # pydub is only used inside the audio pool, so warm the workers rather than this process
+            await prewarm_audio_pool()
+        elif engine.available:
+            await asyncio.to_thread(engine.load)
+            if engine.module is not None:
+                print(f"🔥 Pre-warmed {name} in {engine.import_time_ms}ms")
+
+# pydub load state reported by each audio worker, keyed by pid
+audio_worker_engines = {}
+
+def init_audio_worker():
+    """Runs once in every audio pool worker, before its first job"""
+    ENGINES["pydub"].load()
+
+def audio_worker_status():
+    return os.getpid(), ENGINES["pydub"].status()
+
+def get_audio_pool():
+    """Create the audio post-processing pool on first use"""
+    global audio_pool
+    if audio_pool is None:
+        # spawn, not fork: the server is multi-threaded, and a forked child can inherit locks
+        # (stdout, SSL, imports) held by another thread and deadlock on its first print
+        audio_pool = ProcessPoolExecutor(
+            max_workers=max(1, AUDIO_WORKERS),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_audio_worker
+        )
+    return audio_pool
+
+def reset_audio_pool(pool):
+    """Discard a broken pool, unless another job already replaced it"""
+    global audio_pool
+    if audio_pool is pool:
+        audio_pool = None
+        audio_worker_engines.clear()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+async def prewarm_audio_pool():
+    """Start every audio worker now, which imports pydub in each of them"""
+    if not ENGINES["pydub"].available:
+        return
+    loop = asyncio.get_running_loop()
+    pool = get_audio_pool()
+    try:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(pool, audio_worker_status) for _ in range(max(1, AUDIO_WORKERS))
+        ))
+    except BrokenProcessPool:
+        reset_audio_pool(pool)
+        print("⚠️ Audio pool failed to start while pre-warming")
+        return
+    audio_worker_engines.update(results)
+    print(f"🔥 Pre-warmed pydub in {len(audio_worker_engines)} audio worker(s)")
+
+def pydub_status():
+    """pydub's load state as seen by the audio workers, where it is actually imported"""
+    workers = dict(audio_worker_engines)
+    import_times = [w["import_time_ms"] for w in workers.values() if w["import_time_ms"] is not None]
+    errors = [w["error"] for w in workers.values() if w["error"]]
+    return {
+        "available": ENGINES["pydub"].available and not errors,
+        "loaded": bool(workers) and all(w["loaded"] for w in workers.values()),
+        "import_time_ms": max(import_times) if import_times else None,
+        "error": errors[0] if errors else None,
+        "workers": workers
+    }
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: list[WebSocket] = []
@@ -159,10 +292,9 @@ def fetch_repo_info(owner, repo):
         "pkg": pkg
     }
 
-def generate_prompt(info):
-    return f"""
-Pretend you're a podcast host interviewing a guest developer. Given the following GitHub project details:
-- Name: {info['owner']}/{info['repo']}
+def format_project_details(info):
+    """Project details block shared by the single-call and per-segment prompts"""
+    return f"""- Name: {info['owner']}/{info['repo']}
 - Description: {info['desc']}
 - Main language(s): {', '.join(info['languages'].keys())}
 - Stars: {info['stars']}
@@ -171,7 +303,12 @@ Pretend you're a podcast host interviewing a guest developer. Given the followin
 - Homepage: {info['homepage']}
 - License: {info['license']}
 - README: {info['readme'][:2000]}
-- package.json: {info['pkg'][:1000]}
+- package.json: {info['pkg'][:1000]}"""
+
+def generate_prompt(info):
+    return f"""
+Pretend you're a podcast host interviewing a guest developer. Given the following GitHub project details:
+{format_project_details(info)}
 
 Generate a detailed podcast script (at least 10 minutes long) with natural conversation between host and guest. Cover:
 - What the project is and how it works
@@ -185,7 +322,55 @@ Generate a detailed podcast script (at least 10 minutes long) with natural conve
 Format as a script with clear speaker changes using exactly "Host:" and "Guest:" prefixes. Make it conversational and engaging. Avoid overly technical jargon. Keep individual responses to 2-3 sentences for better audio flow.
 """
 
-def call_gemini(prompt):
+def generate_outline_prompt(info):
+    """Turn the full episode prompt into a request for a short segment outline"""
+    return generate_prompt(info) + f"""
+Do NOT write the script yet. Instead, plan the episode as an outline of {MAX_OUTLINE_SECTIONS} segments or fewer.
+Return one segment per line, formatted exactly as:
+1. <segment title> - <one sentence describing what the host and guest discuss>
+Return only the numbered list, nothing else.
+"""
+
+def generate_section_prompt(info, outline, index):
+    """Prompt for expanding a single outline segment into its script"""
+    title, summary = outline[index]
+    outline_text = '\n'.join(f"{i + 1}. {t} - {d}" for i, (t, d) in enumerate(outline))
+
+    if index == 0:
+        position = "This is the opening segment: the host welcomes listeners and introduces the guest."
+    elif index == len(outline) - 1:
+        position = "This is the closing segment: wrap up the conversation and the host thanks the guest."
+    else:
+        position = "This is a middle segment: do not greet or say goodbye, continue the conversation naturally."
+
+    return f"""
+You are writing one segment of a podcast episode where a host interviews a guest developer about this GitHub project:
+{format_project_details(info)}
+
+Full episode outline:
+{outline_text}
+
+Write ONLY segment {index + 1}: "{title}" - {summary}
+{position}
+
+Format as a script with clear speaker changes using exactly "Host:" and "Guest:" prefixes. Make it conversational and engaging. Avoid overly technical jargon. Keep individual responses to 2-3 sentences for better audio flow. Do not include segment titles or headings.
+"""
+
+def parse_outline(outline_text):
+    """Parse a numbered outline into a list of (title, summary) tuples"""
+    outline = []
+
+    for line in outline_text.split('\n'):
+        match = re.match(r'^\s*\d+[.)]\s*(.+)$', line)
+        if not match:
+            continue
+        item = match.group(1).replace('**', '').strip()
+        title, _, summary = item.partition(' - ')
+        outline.append((title.strip(), summary.strip() or title.strip()))
+
+    return outline[:MAX_OUTLINE_SECTIONS]
+
+def call_gemini(prompt, max_output_tokens=2048):
     model = "gemini-2.0-flash"
     endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={GEMINI_API_KEY}"
     
@@ -200,11 +385,11 @@ def call_gemini(prompt):
             "temperature": 0.9,
             "topP": 1,
             "topK": 1,
-            "maxOutputTokens": 2048
+            "maxOutputTokens": max_output_tokens
         }
     }
 
-    res = requests.post(endpoint, json=body)
+    res = requests.post(endpoint, json=body, timeout=GEMINI_TIMEOUT)
     if not res.ok:
         raise Exception("Gemini API Error: " + res.text)
 
@@ -215,6 +400,50 @@ def call_gemini(prompt):
         print("⚠️ Unexpected Gemini Response:", data)
         return "No valid text response from Gemini."
 
+async def generate_long_script(info):
+    """Generate a long episode: one outline call, then every segment concurrently"""
+    print("📝 Generating episode outline...")
+    outline_text = await asyncio.to_thread(call_gemini, generate_outline_prompt(info), 512)
+    outline = parse_outline(outline_text)
+
+    if not outline:
+        print("⚠️ Could not parse outline, falling back to single-call script")
+        return await asyncio.to_thread(call_gemini, generate_prompt(info))
+
+    print(f"📝 Expanding {len(outline)} segments ({SECTION_CONCURRENCY} at a time)...")
+    loop = asyncio.get_running_loop()
+    # A pool per episode, so segments aren't queued behind other sessions in the shared default executor
+    executor = ThreadPoolExecutor(max_workers=max(1, SECTION_CONCURRENCY), thread_name_prefix="gemini-section")
+
+    async def expand(index):
+        for attempt in range(1, SECTION_ATTEMPTS + 1):
+            try:
+                text = await loop.run_in_executor(executor, call_gemini, generate_section_prompt(info, outline, index))
+                if parse_script_speakers(text):
+                    print(f"✅ Segment {index + 1}/{len(outline)} ready")
+                    return text.strip()
+                print(f"⚠️ Segment {index + 1} attempt {attempt} returned no dialogue")
+            except Exception as e:
+                print(f"⚠️ Segment {index + 1} attempt {attempt} failed: {e}")
+        return ""
+
+    try:
+        # gather() keeps results in outline order regardless of completion order
+        sections = await asyncio.gather(*(expand(i) for i in range(len(outline))))
+    finally:
+        executor.shutdown(wait=False)
+
+    # A missing opening or closing only trims the episode; a missing middle leaves a hole in it
+    missing = [i + 1 for i, section in enumerate(sections) if not section and 0 < i < len(outline) - 1]
+    if missing:
+        raise Exception(f"Gemini failed to write segment(s) {', '.join(map(str, missing))} of the episode outline")
+
+    sections = [section for section in sections if section]
+    if not sections:
+        raise Exception("Gemini returned no script for any segment")
+
+    return '\n\n'.join(sections)
+
 def parse_script_speakers(script_text):
     """Parse the script and separate host and guest parts"""
     lines = script_text.split('\n')
@@ -254,45 +483,101 @@ def clean_text_for_tts(text):
     
     return clean_text
 
-async def combine_audio_with_pydub(file_list, output_filename):
-    """Combine audio files using pydub (more reliable than ffmpeg)"""
-    try:
-        print(f"🔗 Combining {len(file_list)} audio segments with pydub...")
-        
-        combined = AudioSegment.empty()
-        
-        for i, audio_file in enumerate(file_list):
-            if os.path.exists(audio_file) and os.path.getsize(audio_file) > 0:
-                try:
-                    # Load audio segment
-                    segment = AudioSegment.from_mp3(audio_file)
-                    
-                    # Add a small pause between segments
-                    if i > 0:
-                        pause = AudioSegment.silent(duration=500)  # 0.5 second pause
-                        combined += pause
-                    
-                    combined += segment
-                    print(f"✅ Added segment {i+1}/{len(file_list)}")
-                    
-                except Exception as e:
-                    print(f"⚠️ Failed to load segment {audio_file}: {e}")
-                    continue
-        
+def ffmpeg_encode_args(preset):
+    """ffmpeg output options for an entry in AUDIO_PRESETS"""
+    args = ['-c:a', preset["codec"], '-b:a', preset["bitrate"]]
+    if preset["channels"]:
+        args += ['-ac', str(preset["channels"])]
+    if preset["sample_rate"]:
+        args += ['-ar', str(preset["sample_rate"])]
+    return args + preset["extra"] + ['-f', preset["format"]]
+
+def normalize_segment_loudness(segment, target_dbfs=TARGET_LOUDNESS_DBFS):
+    """Bring a segment to the target average loudness so voices from different engines match"""
+    if segment.dBFS == float("-inf"):
+        # Pure silence, nothing to normalize
+        return segment
+    # Never boost a quiet segment so far that its peaks clip
+    gain = min(target_dbfs - segment.dBFS, -PEAK_HEADROOM_DB - segment.max_dBFS)
+    return segment.apply_gain(gain)
+
+def postprocess_audio(file_list, output_filename, preset_name, pause_ms=500):
+    """Worker-process job: normalize each segment, join them and encode through an ffmpeg pipe.
+
+    Returns the duration of the combined audio in milliseconds (0 if nothing
+    was usable) and the worker's ``audio_worker_status()``.
+    """
+    preset = AUDIO_PRESETS[preset_name]
+    AudioSegment = load_engine("pydub").AudioSegment
+    combined = AudioSegment.empty()
+
+    for i, audio_file in enumerate(file_list):
+        if not (os.path.exists(audio_file) and os.path.getsize(audio_file) > 0):
+            continue
+
+        try:
+            segment = AudioSegment.from_file(audio_file)
+        except Exception as e:
+            print(f"⚠️ Failed to load segment {audio_file}: {e}")
+            continue
+
+        segment = normalize_segment_loudness(segment)
+
+        # Add a small pause between segments
         if len(combined) > 0:
-            # Export the combined audio
-            combined.export(output_filename, format="mp3", bitrate="128k")
-            print(f"✅ Successfully combined audio: {len(combined)}ms total")
+            combined += AudioSegment.silent(duration=pause_ms, frame_rate=segment.frame_rate)
+
+        combined += segment
+        print(f"✅ Processed segment {i+1}/{len(file_list)}")
+
+    if len(combined) == 0:
+        return 0, audio_worker_status()
+
+    # Raw 16-bit PCM goes straight into ffmpeg's stdin, no intermediate WAV file
+    combined = combined.set_sample_width(2)
+    cmd = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 's16le', '-ar', str(combined.frame_rate), '-ac', str(combined.channels),
+        '-i', 'pipe:0',
+        *ffmpeg_encode_args(preset),
+        output_filename
+    ]
+    result = subprocess.run(cmd, input=combined.raw_data, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    if result.returncode != 0:
+        raise Exception(f"ffmpeg encode failed with code {result.returncode}: {result.stderr.decode(errors='ignore')}")
+
+    return len(combined), audio_worker_status()
+
+async def combine_audio_with_pydub(file_list, output_filename, preset=AUDIO_PRESET_DEFAULT):
+    """Combine audio files with loudness normalization, encoded in the audio process pool"""
+    try:
+        print(f"🔗 Post-processing {len(file_list)} audio segments ({preset} preset)...")
+
+        loop = asyncio.get_running_loop()
+        pool = get_audio_pool()
+        try:
+            duration, (pid, status) = await loop.run_in_executor(
+                pool, postprocess_audio, file_list, output_filename, preset
+            )
+            audio_worker_engines[pid] = status
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); drop the pool so the next job gets a fresh one
+            reset_audio_pool(pool)
+            raise
+
+        if duration > 0:
+            print(f"✅ Successfully combined audio: {duration}ms total")
             return True
         else:
             print("❌ No audio segments to combine")
             return False
-            
+
     except Exception as e:
-        print(f"❌ Pydub combination failed: {e}")
+        print(f"❌ Audio post-processing failed: {e}")
         return False
 
-async def combine_audio_with_ffmpeg(file_list, output_filename):
+async def combine_audio_with_ffmpeg(file_list, output_filename, preset=AUDIO_PRESET_DEFAULT):
     """Fallback: combine audio files using ffmpeg"""
     try:
         print(f"🔗 Combining {len(file_list)} audio segments with ffmpeg...")
@@ -307,10 +592,16 @@ async def combine_audio_with_ffmpeg(file_list, output_filename):
                     if os.path.exists(audio_file):
                         f.write(f"file '{os.path.abspath(audio_file)}'\n")
             
+            # Stream copy when the segments are already in the target format, otherwise re-encode
+            if preset == "standard" and all(is_mp3_file(f) for f in file_list if os.path.exists(f)):
+                codec_args = ['-c', 'copy']
+            else:
+                codec_args = ffmpeg_encode_args(AUDIO_PRESETS[preset])
+
             # Try to combine with ffmpeg
             process = await asyncio.create_subprocess_exec(
                 'ffmpeg', '-y', '-f', 'concat', '-safe', '0', 
-                '-i', filelist_path, '-c', 'copy', output_filename,
+                '-i', filelist_path, *codec_args, output_filename,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
@@ -330,37 +621,348 @@ async def combine_audio_with_ffmpeg(file_list, output_filename):
         print(f"❌ ffmpeg combination failed: {e}")
         return False
 
-async def combine_audio_simple_concat(file_list, output_filename):
-    """Simple fallback: just use the first valid file or concatenate binary data"""
+# MPEG audio frame tables, keyed by (MPEG-1 or MPEG-2/2.5, layer), in kbps
+MP3_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MP3_SAMPLE_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 25: [11025, 12000, 8000]}
+MP3_COPY_BUFFER = 64 * 1024
+
+def parse_mp3_frame_header(header):
+    """Decode a 4-byte MPEG audio frame header, or return None if it is not a valid one"""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (header[1] >> 3) & 0x3
+    layer_bits = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x3
+    padding = (header[2] >> 1) & 0x1
+
+    # Reserved values, and free-format bitrate which we cannot size
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    version = {0: 25, 2: 2, 3: 1}[version_bits]
+    layer = 4 - layer_bits
+    bitrate = MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][sample_rate_index]
+
+    if layer == 1:
+        length = (12 * bitrate // sample_rate + padding) * 4
+        samples = 384
+    elif layer == 2 or version == 1:
+        length = 144 * bitrate // sample_rate + padding
+        samples = 1152
+    else:
+        length = 72 * bitrate // sample_rate + padding
+        samples = 576
+
+    return {
+        "version": version,
+        "layer": layer,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "channels": 1 if (header[3] >> 6) == 0x3 else 2,
+        "length": length,
+        "samples": samples,
+    }
+
+def mp3_stream_format(frame):
+    """Fields that must match for frames to be played back as one stream"""
+    return (frame["version"], frame["layer"], frame["sample_rate"], frame["channels"])
+
+def xing_tag_offset(frame):
+    """Byte offset of the Xing/Info tag inside a Layer III frame (header + side info)"""
+    if frame["version"] == 1:
+        return 4 + (17 if frame["channels"] == 1 else 32)
+    return 4 + (9 if frame["channels"] == 1 else 17)
+
+def find_next_mp3_frame(f, pos, end):
+    """Resync after junk: find the next offset holding a frame that is followed by another frame"""
+    while pos + 4 <= end:
+        f.seek(pos)
+        chunk = f.read(min(MP3_COPY_BUFFER, end - pos))
+        idx = chunk.find(b'\xff')
+
+        while idx != -1:
+            f.seek(pos + idx)
+            frame = parse_mp3_frame_header(f.read(4))
+            if frame:
+                next_pos = pos + idx + frame["length"]
+                if next_pos == end:
+                    return pos + idx
+                if next_pos < end:
+                    f.seek(next_pos)
+                    if parse_mp3_frame_header(f.read(4)):
+                        return pos + idx
+            idx = chunk.find(b'\xff', idx + 1)
+
+        # Overlap by 3 bytes so a header split across chunks is not missed
+        pos += max(1, len(chunk) - 3)
+
+    return None
+
+def is_mp3_file(path):
+    """Cheap sniff: an MP3 starts with an ID3v2 tag or directly with a frame header"""
+    with open(path, 'rb') as f:
+        head = f.read(4)
+    if head[:3] == b'ID3':
+        return True
+    return parse_mp3_frame_header(head) is not None
+
+def scan_mp3_frames(path):
+    """List the audio frames of an MP3 file as (offset, length, header) tuples.
+
+    ID3v2 and ID3v1 tags, a leading Xing/Info/VBRI frame and any junk between
+    frames are left out, so the frames can be copied into a new stream as-is.
+    """
+    frames = []
+    stream_format = None
+
+    # Without this check, resync would find false frames inside PCM data (e.g. WAV segments)
+    if not is_mp3_file(path):
+        return frames
+
+    with open(path, 'rb') as f:
+        end = os.fstat(f.fileno()).st_size
+
+        # ID3v1 tag lives in the last 128 bytes
+        if end >= 128:
+            f.seek(end - 128)
+            if f.read(3) == b'TAG':
+                end -= 128
+
+        # ID3v2 tag at the start: 10-byte header, synchsafe size, optional footer
+        f.seek(0)
+        head = f.read(10)
+        pos = 0
+        if len(head) == 10 and head[:3] == b'ID3':
+            pos = 10 + ((head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 | (head[9] & 0x7F))
+            if head[5] & 0x10:
+                pos += 10
+
+        while pos + 4 <= end:
+            f.seek(pos)
+            header = f.read(4)
+            frame = parse_mp3_frame_header(header)
+
+            if (frame is None or pos + frame["length"] > end
+                    or (stream_format and mp3_stream_format(frame) != stream_format)):
+                pos = find_next_mp3_frame(f, pos + 1, end)
+                if pos is None:
+                    break
+                continue
+
+            if stream_format is None:
+                stream_format = mp3_stream_format(frame)
+
+                # The old Xing/Info/VBRI frame describes only this file, drop it
+                f.seek(pos)
+                first = f.read(frame["length"])
+                tag_offset = xing_tag_offset(frame)
+                if (frame["layer"] == 3 and first[tag_offset:tag_offset + 4] in (b'Xing', b'Info')) or first[36:40] == b'VBRI':
+                    pos += frame["length"]
+                    continue
+
+            frames.append((pos, frame["length"], frame))
+            pos += frame["length"]
+
+    return frames
+
+def build_xing_frame(first_header, frame_offsets, audio_bytes, is_cbr):
+    """Build a Xing (VBR) or Info (CBR) frame with frame count, byte count and a 100-entry seek table.
+
+    ``frame_offsets`` are the byte offsets of the audio frames relative to the
+    end of the Xing frame. Returns None if no bitrate gives a frame big enough.
+    """
+    base = int.from_bytes(first_header, 'big')
+    base |= 1 << 16     # no CRC
+    base &= ~(1 << 9)   # no padding
+    tag_offset = xing_tag_offset(parse_mp3_frame_header(first_header))
+
+    for bitrate_index in range(1, 15):
+        header = ((base & ~(0xF << 12)) | (bitrate_index << 12)).to_bytes(4, 'big')
+        frame = parse_mp3_frame_header(header)
+        if frame and frame["length"] >= tag_offset + 120:
+            break
+    else:
+        return None
+
+    frame_count = len(frame_offsets)
+    total_bytes = frame["length"] + audio_bytes
+
+    # toc[i] = position (in 1/256ths of the file) of the frame at i% of the duration
+    toc = bytes(
+        min(255, (frame["length"] + frame_offsets[i * frame_count // 100]) * 256 // total_bytes)
+        for i in range(100)
+    )
+
+    tag = (b'Info' if is_cbr else b'Xing') + (0x7).to_bytes(4, 'big')
+    tag += frame_count.to_bytes(4, 'big') + total_bytes.to_bytes(4, 'big') + toc
+
+    data = bytearray(frame["length"])
+    data[:4] = header
+    data[tag_offset:tag_offset + len(tag)] = tag
+    return bytes(data)
+
+def copy_file_range(src, dst, start, length, buffer_size=MP3_COPY_BUFFER):
+    """Copy ``length`` bytes from ``start`` in src to dst using a bounded buffer"""
+    src.seek(start)
+    while length > 0:
+        chunk = src.read(min(buffer_size, length))
+        if not chunk:
+            break
+        dst.write(chunk)
+        length -= len(chunk)
+
+def chapter_index_path(audio_filename):
+    """Where the JSON chapter index for an audio file is written"""
+    return str(Path(audio_filename).with_suffix('.chapters.json'))
+
+def concat_mp3_files(file_list, output_filename, speakers=None):
+    """Join MP3 files frame by frame behind a fresh Xing seek table.
+
+    When ``speakers`` is given, a JSON chapter index of the speaker turns is
+    written beside the output. Returns the number of segments joined (0 if
+    no MP3 frames were found).
+    """
+    segments = []
+    stream_format = None
+
+    for i, path in enumerate(file_list):
+        frames = scan_mp3_frames(path)
+        if not frames:
+            print(f"⚠️ No MP3 frames found in {path}")
+            continue
+        if stream_format is None:
+            stream_format = mp3_stream_format(frames[0][2])
+        elif mp3_stream_format(frames[0][2]) != stream_format:
+            print(f"⚠️ Skipping {path}: sample rate/channels differ from the first segment")
+            continue
+        segments.append((i, path, frames))
+
+    if not segments:
+        return 0
+
+    # Lay out where every frame lands in the output (relative to the end of the Xing frame)
+    frame_offsets = []
+    bitrates = set()
+    audio_bytes = 0
+    for _, _, frames in segments:
+        for _, length, frame in frames:
+            frame_offsets.append(audio_bytes)
+            bitrates.add(frame["bitrate"])
+            audio_bytes += length
+
+    with open(segments[0][1], 'rb') as f:
+        f.seek(segments[0][2][0][0])
+        first_header = f.read(4)
+
+    xing_frame = None
+    if segments[0][2][0][2]["layer"] == 3:
+        xing_frame = build_xing_frame(first_header, frame_offsets, audio_bytes, len(bitrates) == 1)
+    header_bytes = len(xing_frame) if xing_frame else 0
+
+    sample_rate = stream_format[2]
+    chapters = []
+    samples_written = 0
+    bytes_written = 0
+
+    with open(output_filename, 'wb') as outfile:
+        if xing_frame:
+            outfile.write(xing_frame)
+
+        for i, path, frames in segments:
+            chapters.append({
+                "index": len(chapters),
+                "speaker": speakers[i] if speakers else None,
+                "start": round(samples_written / sample_rate, 3),
+                "byte_offset": header_bytes + bytes_written,
+            })
+
+            with open(path, 'rb') as infile:
+                # Frames are usually contiguous, so copy them in runs rather than one by one
+                run_start, run_end = frames[0][0], frames[0][0]
+                for offset, length, frame in frames:
+                    if offset != run_end:
+                        copy_file_range(infile, outfile, run_start, run_end - run_start)
+                        run_start = offset
+                    run_end = offset + length
+                    samples_written += frame["samples"]
+                    bytes_written += length
+                copy_file_range(infile, outfile, run_start, run_end - run_start)
+
+    if speakers:
+        with open(chapter_index_path(output_filename), 'w') as f:
+            json.dump({
+                "audio": os.path.basename(output_filename),
+                "duration": round(samples_written / sample_rate, 3),
+                "chapters": chapters,
+            }, f, indent=2)
+
+    return len(chapters)
+
+async def combine_audio_simple_concat(file_list, output_filename, preset=AUDIO_PRESET_DEFAULT, speakers=None):
+    """Last-resort fallback: stream MP3 frames into one file with a seek table and chapter index"""
     try:
-        print("🔗 Using simple file concatenation...")
+        # Frames are copied untouched, so only the preset that keeps the source stream can be honoured
+        if preset != "standard":
+            print(f"⚠️ Simple concatenation cannot re-encode to the {preset} preset")
+            return False
+
+        print("🔗 Using MP3 frame concatenation...")
         
-        # Find the first valid file
-        valid_files = [f for f in file_list if os.path.exists(f) and os.path.getsize(f) > 0]
+        valid = [(f, speakers[i] if speakers else None) for i, f in enumerate(file_list)
+                 if os.path.exists(f) and os.path.getsize(f) > 0]
         
-        if not valid_files:
+        if not valid:
             return False
         
-        if len(valid_files) == 1:
-            # Just copy the single file
-            shutil.copy2(valid_files[0], output_filename)
-            print("✅ Used single audio file")
-            return True
+        if not all(is_mp3_file(f) for f, _ in valid):
+            print("⚠️ Simple concatenation only supports MP3 segments")
+            return False
+        
+        chapter_count = await asyncio.to_thread(
+            concat_mp3_files, [f for f, _ in valid], output_filename,
+            [s for _, s in valid] if speakers else None
+        )
         
-        # Try simple binary concatenation (works for some formats)
-        with open(output_filename, 'wb') as outfile:
-            for fname in valid_files:
-                with open(fname, 'rb') as infile:
-                    outfile.write(infile.read())
+        if not chapter_count:
+            print("❌ No MP3 audio found to concatenate")
+            return False
         
-        print(f"✅ Simple concatenation of {len(valid_files)} files")
+        print(f"✅ Concatenated {chapter_count} segments with seek table and chapter index")
         return True
         
     except Exception as e:
         print(f"❌ Simple concatenation failed: {e}")
         return False
 
-async def generate_audio_edge_tts(script_text, filename):
+async def combine_audio_segments(temp_files, filename, preset=AUDIO_PRESET_DEFAULT, speakers=None):
+    """Try every combiner in order of quality until one succeeds"""
+    success = False
+    
+    # Method 1: Try pydub (most reliable)
+    if engine_available("pydub") and not success:
+        success = await combine_audio_with_pydub(temp_files, filename, preset)
+    
+    # Method 2: Try ffmpeg
+    if not success:
+        success = await combine_audio_with_ffmpeg(temp_files, filename, preset)
+    
+    # Method 3: Simple fallback
+    if not success:
+        success = await combine_audio_simple_concat(temp_files, filename, preset, speakers)
+    
+    return success
+
+async def generate_audio_edge_tts(script_text, filename, preset=AUDIO_PRESET_DEFAULT):
     """Generate audio using Microsoft Edge TTS with different voices"""
     print("🔊 Generating audio with Edge TTS (dual voice)...")
     
@@ -370,9 +972,14 @@ async def generate_audio_edge_tts(script_text, filename):
         print("⚠️ No speakers found")
         return False
     
+    edge_tts = load_engine("edge_tts")
+    if edge_tts is None:
+        return False
+    
     # Create a temporary directory for audio segments
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_files = []
+        temp_speakers = []
         
         # Define voices for host and guest
         host_voice = "en-US-JennyNeural"  # Female voice
@@ -396,6 +1003,7 @@ async def generate_audio_edge_tts(script_text, filename):
                     
                     if os.path.exists(temp_filename) and os.path.getsize(temp_filename) > 0:
                         temp_files.append(temp_filename)
+                        temp_speakers.append(speaker)
                         print(f"📦 Created {speaker} segment {i} with {voice}")
                     else:
                         print(f"⚠️ Empty audio file for segment {i}")
@@ -406,25 +1014,11 @@ async def generate_audio_edge_tts(script_text, filename):
         
         # Try multiple methods to combine audio files
         if temp_files:
-            success = False
-            
-            # Method 1: Try pydub (most reliable)
-            if PYDUB_AVAILABLE and not success:
-                success = await combine_audio_with_pydub(temp_files, filename)
-            
-            # Method 2: Try ffmpeg
-            if not success:
-                success = await combine_audio_with_ffmpeg(temp_files, filename)
-            
-            # Method 3: Simple fallback
-            if not success:
-                success = await combine_audio_simple_concat(temp_files, filename)
-            
-            return success
+            return await combine_audio_segments(temp_files, filename, preset, temp_speakers)
     
     return False
 
-async def generate_audio_pyttsx3_dual(script_text, filename):
+async def generate_audio_pyttsx3_dual(script_text, filename, preset=AUDIO_PRESET_DEFAULT):
     """Generate audio using pyttsx3 with voice switching"""
     try:
         print("🔊 Generating audio with pyttsx3 (dual voice)...")
@@ -433,7 +1027,10 @@ async def generate_audio_pyttsx3_dual(script_text, filename):
         if not speakers:
             return False
         
-        import threading
+        pyttsx3 = load_engine("pyttsx3")
+        if pyttsx3 is None:
+            return False
+        
         import queue
         
         def tts_worker(text_queue, file_queue, voice_id):
@@ -458,7 +1055,7 @@ async def generate_audio_pyttsx3_dual(script_text, filename):
                     engine.runAndWait()
                     
                     if os.path.exists(temp_file):
-                        file_queue.put(temp_file)
+                        file_queue.put((idx, temp_file))
                     
                     text_queue.task_done()
                     
@@ -472,7 +1069,8 @@ async def generate_audio_pyttsx3_dual(script_text, filename):
         
         # Start worker threads
         host_thread = threading.Thread(target=tts_worker, args=(host_queue, file_queue, 0))
-        guest_thread = threading.Thread(target=tts_worker, args=(guest_queue, file_queue, 1 if len(pyttsx3.init().getProperty('voices')) > 1 else 0))
+        # The worker keeps the default voice if there is no second one
+        guest_thread = threading.Thread(target=tts_worker, args=(guest_queue, file_queue, 1))
         
         host_thread.start()
         guest_thread.start()
@@ -494,17 +1092,17 @@ async def generate_audio_pyttsx3_dual(script_text, filename):
         host_thread.join()
         guest_thread.join()
         
-        # Collect generated files
-        temp_files = []
+        # Collect generated files, back in script order (the two workers finish interleaved)
+        generated = []
         while not file_queue.empty():
-            temp_files.append(file_queue.get())
+            generated.append(file_queue.get())
+        generated.sort()
+        temp_files = [temp_file for _, temp_file in generated]
+        temp_speakers = [speakers[idx][0] for idx, _ in generated]
         
         # Combine files
         if temp_files:
-            if PYDUB_AVAILABLE:
-                success = await combine_audio_with_pydub(temp_files, filename)
-            else:
-                success = await combine_audio_simple_concat(temp_files, filename)
+            success = await combine_audio_segments(temp_files, filename, preset, temp_speakers)
             
             # Clean up
             for temp_file in temp_files:
@@ -518,7 +1116,7 @@ async def generate_audio_pyttsx3_dual(script_text, filename):
     
     return False
 
-async def generate_audio_gtts_single(script_text, filename):
+async def generate_audio_gtts_single(script_text, filename, preset=AUDIO_PRESET_DEFAULT):
     """Generate audio using Google TTS (single voice fallback)"""
     try:
         print("🔊 Using Google TTS (single voice fallback)...")
@@ -528,18 +1126,34 @@ async def generate_audio_gtts_single(script_text, filename):
         clean_text = clean_text_for_tts(clean_text)
         clean_text = re.sub(r'\n+', '. ', clean_text)
         
-        if clean_text:
-            tts = gTTS(text=clean_text, lang='en', slow=False)
-            tts.save(filename)
-            print("✅ Generated single voice audio with gTTS")
-            return True
+        gtts = load_engine("gtts")
+        if clean_text and gtts is not None:
+            tts = gtts.gTTS(text=clean_text, lang='en', slow=False)
+
+            if preset == "standard":
+                tts.save(filename)
+                print("✅ Generated single voice audio with gTTS")
+                return True
+
+            # Other presets need the gTTS MP3 re-encoded by the post-processing stage
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_filename = os.path.join(temp_dir, "temp_gtts.mp3")
+                tts.save(temp_filename)
+                if engine_available("pydub"):
+                    success = await combine_audio_with_pydub([temp_filename], filename, preset)
+                else:
+                    success = await combine_audio_with_ffmpeg([temp_filename], filename, preset)
+
+            if success:
+                print("✅ Generated single voice audio with gTTS")
+            return success
             
     except Exception as e:
         print(f"❌ gTTS failed: {e}")
     
     return False
 
-async def generate_audio_sapi_dual(script_text, filename):
+async def generate_audio_sapi_dual(script_text, filename, preset=AUDIO_PRESET_DEFAULT):
     """Generate audio using Windows SAPI with dual voices"""
     try:
         print("🔊 Generating audio with Windows SAPI (dual voice)...")
@@ -548,13 +1162,16 @@ async def generate_audio_sapi_dual(script_text, filename):
         if not speakers:
             return False
         
-        import comtypes.client
+        comtypes_client = load_engine("sapi")
+        if comtypes_client is None:
+            return False
         
         # Initialize SAPI
-        sapi = comtypes.client.CreateObject("SAPI.SpVoice")
+        sapi = comtypes_client.CreateObject("SAPI.SpVoice")
         voices = sapi.GetVoices()
         
         temp_files = []
+        temp_speakers = []
         
         for i, (speaker, text) in enumerate(speakers):
             clean_text = clean_text_for_tts(text)
@@ -573,7 +1190,7 @@ async def generate_audio_sapi_dual(script_text, filename):
                     sapi.Voice = voices.Item(0)
                 
                 # Set up file output
-                file_stream = comtypes.client.CreateObject("SAPI.SpFileStream")
+                file_stream = comtypes_client.CreateObject("SAPI.SpFileStream")
                 file_stream.Open(temp_filename, 3)  # Write mode
                 sapi.AudioOutputStream = file_stream
                 
@@ -583,6 +1200,7 @@ async def generate_audio_sapi_dual(script_text, filename):
                 
                 if os.path.exists(temp_filename) and os.path.getsize(temp_filename) > 0:
                     temp_files.append(temp_filename)
+                    temp_speakers.append(speaker)
                     print(f"📦 Created {speaker} segment {i} with SAPI")
                 
             except Exception as e:
@@ -591,10 +1209,7 @@ async def generate_audio_sapi_dual(script_text, filename):
         
         # Combine files
         if temp_files:
-            if PYDUB_AVAILABLE:
-                success = await combine_audio_with_pydub(temp_files, filename)
-            else:
-                success = await combine_audio_simple_concat(temp_files, filename)
+            success = await combine_audio_segments(temp_files, filename, preset, temp_speakers)
             
             # Clean up
             for temp_file in temp_files:
@@ -608,29 +1223,29 @@ async def generate_audio_sapi_dual(script_text, filename):
     
     return False
 
-async def generate_audio_with_fallbacks(script_text, filename):
+async def generate_audio_with_fallbacks(script_text, filename, preset=AUDIO_PRESET_DEFAULT):
     """Try multiple TTS engines with dual voice support and fallbacks"""
     success = False
     
     # Method 1: Edge TTS (best quality, dual voice)
-    if EDGE_TTS_AVAILABLE and not success:
+    if engine_available("edge_tts") and not success:
         print("🎯 Trying Edge TTS...")
-        success = await generate_audio_edge_tts(script_text, filename)
+        success = await generate_audio_edge_tts(script_text, filename, preset)
     
     # Method 2: Windows SAPI (dual voice, Windows only)
-    if SAPI_AVAILABLE and not success:
+    if engine_available("sapi") and not success:
         print("🎯 Trying Windows SAPI...")
-        success = await generate_audio_sapi_dual(script_text, filename)
+        success = await generate_audio_sapi_dual(script_text, filename, preset)
     
     # Method 3: pyttsx3 (dual voice attempt)
-    if PYTTSX3_AVAILABLE and not success:
+    if engine_available("pyttsx3") and not success:
         print("🎯 Trying pyttsx3...")
-        success = await generate_audio_pyttsx3_dual(script_text, filename)
+        success = await generate_audio_pyttsx3_dual(script_text, filename, preset)
     
     # Method 4: Google TTS (single voice fallback)
-    if GTTS_AVAILABLE and not success:
+    if engine_available("gtts") and not success:
         print("🎯 Trying Google TTS (single voice)...")
-        success = await generate_audio_gtts_single(script_text, filename)
+        success = await generate_audio_gtts_single(script_text, filename, preset)
     
     return success
 
@@ -645,9 +1260,14 @@ async def websocket_endpoint(websocket: WebSocket):
             
             if message["type"] == "generate_podcast":
                 repo_url = message["repo_url"]
+                long_form = message.get("long_form", LONG_FORM_DEFAULT)
+                audio_preset = message.get("audio_preset", AUDIO_PRESET_DEFAULT)
                 session_id = str(uuid.uuid4())
                 
                 try:
+                    if audio_preset not in AUDIO_PRESETS:
+                        raise Exception(f"Unknown audio preset '{audio_preset}'. Choose from: {', '.join(AUDIO_PRESETS)}")
+
                     # Send progress updates
                     await manager.send_message(websocket, {
                         "type": "progress",
@@ -666,8 +1286,11 @@ async def websocket_endpoint(websocket: WebSocket):
                     })
                     
                     # Generate script
-                    prompt = generate_prompt(info)
-                    podcast_text = call_gemini(prompt)
+                    if long_form:
+                        podcast_text = await generate_long_script(info)
+                    else:
+                        prompt = generate_prompt(info)
+                        podcast_text = await asyncio.to_thread(call_gemini, prompt)
                     
                     await manager.send_message(websocket, {
                         "type": "progress",
@@ -676,14 +1299,14 @@ async def websocket_endpoint(websocket: WebSocket):
                     })
                     
                     # Generate audio with multiple fallback methods
-                    audio_filename = f"podcast_{owner}_{repo}_{session_id}.mp3"
+                    audio_ext = AUDIO_PRESETS[audio_preset]["ext"]
+                    audio_filename = f"podcast_{owner}_{repo}_{session_id}.{audio_ext}"
                     audio_path = f"static/audio/{audio_filename}"
                     
-                    success = await generate_audio_with_fallbacks(podcast_text, audio_path)
+                    success = await generate_audio_with_fallbacks(podcast_text, audio_path, audio_preset)
                     
                     if success and os.path.exists(audio_path) and os.path.getsize(audio_path) > 0:
-                        # Send completion message
-                        await manager.send_message(websocket, {
+                        ready_message = {
                             "type": "podcast_ready",
                             "audio_url": f"/static/audio/{audio_filename}",
                             "script": podcast_text,
@@ -694,7 +1317,15 @@ async def websocket_endpoint(websocket: WebSocket):
                                 "stars": info["stars"],
                                 "languages": list(info["languages"].keys())
                             }
-                        })
+                        }
+
+                        # Speaker-turn index, only written by the MP3 frame concatenator
+                        chapters_path = chapter_index_path(audio_path)
+                        if os.path.exists(chapters_path):
+                            ready_message["chapters_url"] = "/" + chapters_path
+
+                        # Send completion message
+                        await manager.send_message(websocket, ready_message)
                     else:
                         raise Exception("Failed to generate audio file with any available TTS engine")
                         
@@ -707,6 +1338,19 @@ async def websocket_endpoint(websocket: WebSocket):
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
+prewarm_task = None
+
+@app.on_event("startup")
+async def start_prewarm():
+    global prewarm_task
+    if PREWARM_ENGINES:
+        prewarm_task = asyncio.create_task(prewarm_engines(PREWARM_ENGINES))
+
+@app.on_event("shutdown")
+async def shutdown_audio_pool():
+    if audio_pool is not None:
+        audio_pool.shutdown(wait=False, cancel_futures=True)
+
 @app.get("/")
 async def read_index():
     return {"message": "GitHub Podcast Generator API"}
@@ -716,11 +1360,13 @@ async def health_check():
     return {
         "status": "healthy",
         "tts_engines": {
-            "edge_tts": EDGE_TTS_AVAILABLE,
-            "pyttsx3": PYTTSX3_AVAILABLE,
-            "gtts": GTTS_AVAILABLE,
-            "sapi": SAPI_AVAILABLE,
-            "pydub": PYDUB_AVAILABLE
+            name: pydub_status() if name == "pydub" else engine.status()
+            for name, engine in ENGINES.items()
+        },
+        "audio": {
+            "default_preset": AUDIO_PRESET_DEFAULT,
+            "presets": list(AUDIO_PRESETS),
+            "workers": AUDIO_WORKERS
         },
         "api_keys": {
             "github": bool(GITHUB_API_KEY),
@@ -733,11 +1379,11 @@ if __name__ == "__main__":
     
     print("🚀 Starting GitHub Podcast Generator Server...")
     print("📋 Available TTS Engines:")
-    print(f"   Edge TTS: {'✅' if EDGE_TTS_AVAILABLE else '❌'}")
-    print(f"   pyttsx3: {'✅' if PYTTSX3_AVAILABLE else '❌'}")
-    print(f"   gTTS: {'✅' if GTTS_AVAILABLE else '❌'}")
-    print(f"   Windows SAPI: {'✅' if SAPI_AVAILABLE else '❌'}")
-    print(f"   Pydub (audio processing): {'✅' if PYDUB_AVAILABLE else '❌'}")
+    print(f"   Edge TTS: {'✅' if engine_available('edge_tts') else '❌'}")
+    print(f"   pyttsx3: {'✅' if engine_available('pyttsx3') else '❌'}")
+    print(f"   gTTS: {'✅' if engine_available('gtts') else '❌'}")
+    print(f"   Windows SAPI: {'✅' if engine_available('sapi') else '❌'}")
+    print(f"   Pydub (audio processing): {'✅' if engine_available('pydub') else '❌'}")
     print("🔑 API Keys:")
     print(f"   GitHub: {'✅' if GITHUB_API_KEY else '❌'}")
     print(f"   Gemini: {'✅' if GEMINI_API_KEY else '❌'}")